@@ -13,24 +13,58 @@
 # limitations under the License.
 # ==============================================================================
 
-from math import log
-
 from rlgraph import get_backend
 from rlgraph.components.action_adapters import ActionAdapter
 from rlgraph.utils.decorators import graph_fn
 from rlgraph.utils.ops import DataOpTuple
-from rlgraph.utils.util import SMALL_NUMBER
+from rlgraph.utils.rlgraph_errors import RLGraphError
 
 if get_backend() == "tf":
     import tensorflow as tf
 elif get_backend() == "pytorch":
     import torch
 
+    @torch.jit.script
+    def _stabilize_torch(adapter_outputs):
+        # type: (torch.Tensor) -> torch.Tensor
+        """
+        Scripted (fusable) softplus + 1 for both alpha and beta (still together in `adapter_outputs`).
+        """
+        return torch.nn.functional.softplus(adapter_outputs) + 1.0
+
 
 class BetaDistributionAdapter(ActionAdapter):
     """
     Action adapter for the Beta distribution
     """
+    def __init__(self, action_space, bf16_stabilization=False, scope="action-adapter", **kwargs):
+        """
+        Args:
+            bf16_stabilization (bool): Whether to run the (memory-bound) softplus stabilization of alpha and
+                beta in bfloat16 (tf only). Only useful on hardware with native bfloat16 support (e.g. AVX512-BF16
+                CPUs or Ampere GPUs). Outputs are cast back to the input dtype, but keep bfloat16's rounding
+                (~1/128 relative error on alpha and beta). Default: False.
+
+        Raises:
+            RLGraphError: If `bf16_stabilization` is True, but the backend is not tf.
+        """
+        self.bf16_stabilization = bf16_stabilization
+        if self.bf16_stabilization is True and get_backend() != "tf":
+            raise RLGraphError("ERROR: `bf16_stabilization` is only supported on the tf backend!")
+
+        # Whether alpha/beta need their last dim squeezed to match a 0D action Space (decided at build time).
+        self._squeeze_last_dim = None
+        # Backend-specific alpha/beta computation (bound once instead of checking the backend on each call).
+        self._get_alpha_and_beta = self._get_alpha_and_beta_tf if get_backend() == "tf" else \
+            self._get_alpha_and_beta_pytorch
+
+        super(BetaDistributionAdapter, self).__init__(action_space, scope=scope, **kwargs)
+
+    def check_input_spaces(self, input_spaces, action_space=None):
+        super(BetaDistributionAdapter, self).check_input_spaces(input_spaces, action_space)
+        # If action_space is 0D, alpha/beta come out with an extra (size 1) last dim.
+        self._squeeze_last_dim = self.action_space.shape == ()
+
     def get_units_and_shape(self):
         units = 2 * self.action_space.flat_dim  # Those two dimensions are the mean and log sd
         # Add moments (2x for each action item).
@@ -42,47 +76,44 @@ class BetaDistributionAdapter(ActionAdapter):
 
     @graph_fn
     def _graph_fn_get_parameters_from_adapter_outputs(self, adapter_outputs):
-        parameters = None
-
-        full_action_space_rank = len(self.action_space.get_shape(with_batch_rank=True, with_time_rank=True))
-
-        if get_backend() == "tf":
-            # Stabilize both alpha and beta (currently together in last_nn_layer_output).
-            parameters = tf.clip_by_value(
-                adapter_outputs, clip_value_min=log(SMALL_NUMBER), clip_value_max=-log(SMALL_NUMBER)
-            )
-            parameters = tf.math.log((tf.exp(parameters) + 1.0)) + 1.0
-            alpha, beta = tf.split(parameters, num_or_size_splits=2, axis=-1)
-
-            # If action_space is 0D, we have to squeeze the params by 1 dim to make them match our action_space.
-            if full_action_space_rank != len(alpha.shape.as_list()):
-                # Assume a difference by exactly 1 dim.
-                assert len(alpha.shape.as_list()) == full_action_space_rank + 1
-                alpha = tf.squeeze(alpha, axis=-1)
-                beta = tf.squeeze(beta, axis=-1)
-
-            alpha._batch_rank = 0
-            beta._batch_rank = 0
-
-            parameters = DataOpTuple([alpha, beta])
-
-        elif get_backend() == "pytorch":
-            # Stabilize both alpha and beta (currently together in last_nn_layer_output).
-            parameters = torch.clamp(
-                adapter_outputs, min=log(SMALL_NUMBER), max=-log(SMALL_NUMBER)
-            )
-            parameters = torch.log((torch.exp(parameters) + 1.0)) + 1.0
-
-            # Split in the middle.
-            alpha, beta = torch.split(parameters, split_size_or_sections=int(parameters.shape[0] / 2), dim=-1)
-
-            # If action_space is 0D, we have to squeeze the params by 1 dim to make them match our action_space.
-            if full_action_space_rank != len(list(alpha.size)):
-                # Assume a difference by exactly 1 dim.
-                assert len(list(alpha.size)) == full_action_space_rank + 1
-                alpha = torch.squeeze(alpha, dim=-1)
-                beta = torch.squeeze(beta, dim=-1)
-
-            parameters = DataOpTuple([alpha, beta])
-
-        return parameters, None, None
+        alpha, beta = self._get_alpha_and_beta(adapter_outputs)
+        return DataOpTuple(alpha, beta), None, None
+
+    def _get_alpha_and_beta_tf(self, adapter_outputs):
+        # Stabilize both alpha and beta (currently together in last_nn_layer_output).
+        # Mark the elementwise chain (casts, softplus, +1) for XLA, which fuses it into a single kernel
+        # (the attribute is ignored by TF builds without XLA support).
+        with tf.xla.experimental.jit_scope():
+            parameters = adapter_outputs
+            if self.bf16_stabilization is True:
+                parameters = tf.cast(parameters, dtype=tf.bfloat16)
+            # softplus(x) = log(exp(x) + 1) as a single, numerically stable op.
+            # No pre-clipping needed: softplus never overflows and softplus(x) + 1 >= 1 already bounds alpha and beta.
+            parameters = tf.nn.softplus(parameters) + 1.0
+            if self.bf16_stabilization is True:
+                parameters = tf.cast(parameters, dtype=adapter_outputs.dtype)
+        alpha, beta = tf.split(parameters, num_or_size_splits=2, axis=-1)
+
+        # If action_space is 0D, we have to squeeze the params by 1 dim to make them match our action_space.
+        if self._squeeze_last_dim:
+            alpha = tf.squeeze(alpha, axis=-1)
+            beta = tf.squeeze(beta, axis=-1)
+
+        alpha._batch_rank = 0
+        beta._batch_rank = 0
+
+        return alpha, beta
+
+    def _get_alpha_and_beta_pytorch(self, adapter_outputs):
+        # Stabilize both alpha and beta (currently together in last_nn_layer_output).
+        parameters = _stabilize_torch(adapter_outputs)
+
+        # Split in the middle.
+        alpha, beta = torch.chunk(parameters, chunks=2, dim=-1)
+
+        # If action_space is 0D, we have to squeeze the params by 1 dim to make them match our action_space.
+        if self._squeeze_last_dim:
+            alpha = torch.squeeze(alpha, dim=-1)
+            beta = torch.squeeze(beta, dim=-1)
+
+        return alpha, beta
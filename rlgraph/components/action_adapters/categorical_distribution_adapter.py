@@ -13,10 +13,13 @@
 # limitations under the License.
 # ==============================================================================
 
+from math import log
+
 from rlgraph import get_backend
 from rlgraph.components.action_adapters import ActionAdapter
 from rlgraph.spaces.space_utils import sanity_check_space
-from rlgraph.utils.decorators import graph_fn
+from rlgraph.utils.decorators import graph_fn, rlgraph_api
+from rlgraph.utils.rlgraph_errors import RLGraphError
 from rlgraph.utils.util import SMALL_NUMBER
 
 
@@ -24,13 +27,47 @@ if get_backend() == "tf":
     import tensorflow as tf
 elif get_backend() == "pytorch":
     import torch
-    from rlgraph.utils.pytorch_util import SMALL_NUMBER_TORCH
+
+# Lower bound for log-probs (equivalent to flooring the probs at SMALL_NUMBER).
+_LOG_SMALL_NUMBER = log(SMALL_NUMBER)
 
 
 class CategoricalDistributionAdapter(ActionAdapter):
     """
     Action adapter for the Categorical distribution.
     """
+    def __init__(self, action_space, torch_compile=False, scope="action-adapter", **kwargs):
+        """
+        Args:
+            torch_compile (bool): Whether to compile the log-softmax/softmax computation via `torch.compile`
+                (pytorch only; requires torch>=2.0). Fuses the ops into a single kernel at the cost of a compilation
+                on the first call. Uses "reduce-overhead" mode (CUDA graphs), so it only pays off on CUDA with a fixed
+                batch size: On CPU, CUDA graphs are skipped (with a warning), and the first change in batch size
+                triggers one more (dynamic-shape) compilation. Default: False.
+
+        Raises:
+            RLGraphError: If `torch_compile` is True, but the backend is not pytorch (or torch.compile is missing).
+        """
+        self.torch_compile = torch_compile
+        if self.torch_compile is True and get_backend() != "pytorch":
+            raise RLGraphError("ERROR: `torch_compile` is only supported on the pytorch backend!")
+
+        # Backend-specific computations (bound once instead of checking the backend on each call).
+        if get_backend() == "tf":
+            self._get_parameters_probs_log_probs = self._get_parameters_probs_log_probs_tf
+            self._get_log_prob_of_actions = self._get_log_prob_of_actions_tf
+        else:
+            self._get_parameters_probs_log_probs = self._get_parameters_probs_log_probs_pytorch
+            self._get_log_prob_of_actions = self._get_log_prob_of_actions_pytorch
+            if self.torch_compile is True:
+                if not hasattr(torch, "compile"):
+                    raise RLGraphError("ERROR: `torch_compile` requires torch>=2.0 (`torch.compile` not found)!")
+                self._get_parameters_probs_log_probs = torch.compile(
+                    self._get_parameters_probs_log_probs_pytorch, dynamic=None, mode="reduce-overhead"
+                )
+
+        super(CategoricalDistributionAdapter, self).__init__(action_space, scope=scope, **kwargs)
+
     def check_input_spaces(self, input_spaces, action_space=None):
         super(CategoricalDistributionAdapter, self).check_input_spaces(input_spaces, action_space)
         # IntBoxes must have categories.
@@ -41,7 +78,7 @@ class CategoricalDistributionAdapter(ActionAdapter):
         new_shape = self.action_space.get_shape(with_category_rank=True)
         return units, new_shape
 
-    @graph_fn
+    @graph_fn(returns=3)
     def _graph_fn_get_parameters_from_adapter_outputs(self, adapter_outputs):
         """
         Returns:
@@ -49,23 +86,62 @@ class CategoricalDistributionAdapter(ActionAdapter):
                 - DataOp: Raw logits (parameters for a Categorical Distribution).
                 - DataOp: log-probs: log(softmaxed_logits).
         """
-        parameters = adapter_outputs
-        probs = None
-        log_probs = None
+        return self._get_parameters_probs_log_probs(adapter_outputs)
 
-        if get_backend() == "tf":
-            parameters._batch_rank = 0
-            # Probs (softmax).
-            probs = tf.maximum(x=tf.nn.softmax(logits=parameters, axis=-1), y=SMALL_NUMBER)
-            probs._batch_rank = 0
-            # Log probs.
-            log_probs = tf.math.log(x=probs)
-            log_probs._batch_rank = 0
-
-        elif get_backend() == "pytorch":
-            # Probs (softmax).
-            probs = torch.max(torch.softmax(parameters, dim=-1), SMALL_NUMBER_TORCH)
-            # Log probs.
-            log_probs = torch.log(probs)
+    @staticmethod
+    def _get_parameters_probs_log_probs_tf(parameters):
+        parameters._batch_rank = 0
+        # Log probs (fused log-softmax instead of log(softmax)).
+        log_probs = tf.maximum(x=tf.nn.log_softmax(logits=parameters, axis=-1), y=_LOG_SMALL_NUMBER)
+        log_probs._batch_rank = 0
+        # Probs (softmax).
+        probs = tf.exp(x=log_probs)
+        probs._batch_rank = 0
+        return parameters, probs, log_probs
 
+    @staticmethod
+    def _get_parameters_probs_log_probs_pytorch(parameters):
+        # Log probs (fused log-softmax instead of log(softmax)).
+        log_probs = torch.clamp_min(torch.log_softmax(parameters, dim=-1), _LOG_SMALL_NUMBER)
+        # Probs (softmax).
+        probs = torch.exp(log_probs)
         return parameters, probs, log_probs
+
+    @rlgraph_api(must_be_complete=False)
+    def get_log_prob_of_actions(self, adapter_outputs, actions):
+        """
+        Args:
+            adapter_outputs (SingleDataOp): The (action-space reshaped) output of the action adapter's action layer.
+            actions (SingleDataOp): The actions for which to return the log-probs.
+
+        Returns:
+            SingleDataOp: The log-probs of the given `actions`.
+        """
+        return self._graph_fn_get_log_prob_of_actions(adapter_outputs, actions)
+
+    @graph_fn
+    def _graph_fn_get_log_prob_of_actions(self, adapter_outputs, actions):
+        """
+        Computes log(softmax(logits))[action] directly as logits[action] - logsumexp(logits), without
+        materializing the full probs/log-probs tensors over all categories.
+
+        Args:
+            adapter_outputs (SingleDataOp): Raw logits.
+            actions (SingleDataOp): The (int) actions for which to return the log-probs.
+
+        Returns:
+            SingleDataOp: The log-probs of the given `actions` (shape of `actions`).
+        """
+        return self._get_log_prob_of_actions(adapter_outputs, actions)
+
+    @staticmethod
+    def _get_log_prob_of_actions_tf(adapter_outputs, actions):
+        action_logits = tf.gather(params=adapter_outputs, indices=actions, batch_dims=actions.shape.ndims)
+        log_probs = action_logits - tf.reduce_logsumexp(adapter_outputs, axis=-1)
+        log_probs._batch_rank = 0
+        return log_probs
+
+    @staticmethod
+    def _get_log_prob_of_actions_pytorch(adapter_outputs, actions):
+        action_logits = adapter_outputs.gather(-1, actions.long().unsqueeze(-1)).squeeze(-1)
+        return action_logits - torch.logsumexp(adapter_outputs, dim=-1)
@@ -131,11 +131,6 @@ class LayerCallOutput(object):
 
         self.var_name = None
 
-    #def __eq__(self, other):
-    #    if other in self.inputs_needed or self.output_slot != other.output_slot:
-    #        return False
-    #    return True
-
     def __lt__(self, other):
         # If `self` is dependent on the `other`, put self first.
         if other in self.inputs_needed:
@@ -149,13 +144,3 @@ class LayerCallOutput(object):
             return False
         # Otherwise, sort by output-slot.
         return self.output_slot > other.output_slot
-
-    #def __le__(self, other):
-    #    if other in self.inputs_needed:
-    #        return True
-    #    return self.output_slot <= other.output_slot
-
-    #def __ge__(self, other):
-    #    if other in self.inputs_needed:
-    #        return False
-    #    return self.output_slot <= other.output_slot
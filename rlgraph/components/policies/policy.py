@@ -407,6 +407,9 @@ class Policy(Component):
             FlattenedDataOp: A DataOpDict with the different distributions' `log_prob` outputs. Keys always correspond
                 to structure of `self.action_space`.
         """
+        # Action adapters that can compute the actions' log-probs directly (w/o building the full distribution).
+        if hasattr(self.action_adapters.get(flat_key), "get_log_prob_of_actions"):
+            return self.action_adapters[flat_key].get_log_prob_of_actions(parameters, actions)
         return self.distributions[flat_key].log_prob(parameters, actions)
 
     @graph_fn(flatten_ops=True)
@@ -18,10 +18,16 @@ from __future__ import absolute_import, division, print_function
 import unittest
 
 import numpy as np
-from rlgraph.components.action_adapters import BernoulliDistributionAdapter, CategoricalDistributionAdapter
+from rlgraph import get_backend
+from rlgraph.components.action_adapters import BernoulliDistributionAdapter, BetaDistributionAdapter, \
+    CategoricalDistributionAdapter
 from rlgraph.spaces import *
 from rlgraph.tests import ComponentTest
 from rlgraph.utils.numpy import softmax, sigmoid, relu
+from rlgraph.utils.rlgraph_errors import RLGraphError
+
+if get_backend() == "pytorch":
+    import torch
 
 
 class TestActionAdapters(unittest.TestCase):
@@ -59,6 +65,53 @@ class TestActionAdapters(unittest.TestCase):
             log_probs=expected_log_probs
         ), decimals=5)
 
+    @unittest.skipIf(get_backend() != "tf", "bfloat16 stabilization only exists on the tf backend.")
+    def test_beta_action_adapter_with_bf16_stabilization(self):
+        # Last NN layer.
+        previous_nn_layer_space = FloatBox(shape=(16,), add_batch_rank=True)
+        adapter_outputs_space = FloatBox(shape=(4,), add_batch_rank=True)
+        # Action Space.
+        action_space = FloatBox(low=-1.0, high=1.0, shape=(2,))
+
+        action_adapter = BetaDistributionAdapter(action_space=action_space, bf16_stabilization=True)
+        test = ComponentTest(
+            component=action_adapter, input_spaces=dict(
+                inputs=previous_nn_layer_space,
+                adapter_outputs=adapter_outputs_space,
+            ), action_space=action_space
+        )
+
+        # Batch of n samples.
+        adapter_outputs = adapter_outputs_space.sample(32)
+
+        # fp32 reference: softplus + 1, then split in the middle.
+        expected_parameters = np.log(np.exp(adapter_outputs) + 1.0) + 1.0
+        expected_parameters = tuple([expected_parameters[:, :2], expected_parameters[:, 2:]])
+        # bfloat16 only has an 8-bit mantissa -> compare at a coarse precision.
+        out = test.test(("get_parameters_from_adapter_outputs", adapter_outputs, ["parameters"]), expected_outputs=dict(
+            parameters=expected_parameters
+        ), decimals=1)
+
+        def to_bfloat16(x):
+            # Round-to-nearest-even float32 -> bfloat16 (upper 16 bits), returned as float32.
+            bits = np.asarray(x, dtype=np.float32).view(np.uint32)
+            bits = (bits + np.uint32(0x7fff) + ((bits >> np.uint32(16)) & np.uint32(1))) & np.uint32(0xffff0000)
+            return bits.view(np.float32)
+
+        # Only the bf16 path produces these: Every value is exactly representable in bfloat16, matches the
+        # bfloat16-rounded reference up to bf16's rounding and (at least somewhere) differs from the fp32 values.
+        for actual, expected in zip(out["parameters"], expected_parameters):
+            actual = np.asarray(actual, dtype=np.float32)
+            np.testing.assert_array_equal(actual, to_bfloat16(actual))
+            np.testing.assert_allclose(actual, to_bfloat16(expected), rtol=2 ** -7)
+            self.assertTrue(np.any(actual != expected.astype(np.float32)))
+
+    @unittest.skipIf(get_backend() == "tf", "Only non-tf backends reject `bf16_stabilization`.")
+    def test_beta_action_adapter_bf16_stabilization_on_non_tf_backend(self):
+        self.assertRaises(
+            RLGraphError, BetaDistributionAdapter, action_space=FloatBox(shape=(2,)), bf16_stabilization=True
+        )
+
     def test_simple_action_adapter(self):
         # Last NN layer.
         previous_nn_layer_space = FloatBox(shape=(16,), add_batch_rank=True)
@@ -93,6 +146,68 @@ class TestActionAdapters(unittest.TestCase):
             log_probs=expected_log_probs
         ), decimals=5)
 
+    def test_categorical_action_adapter_log_prob_of_actions(self):
+        # Last NN layer.
+        previous_nn_layer_space = FloatBox(shape=(16,), add_batch_rank=True)
+        adapter_outputs_space = FloatBox(shape=(3, 2, 2), add_batch_rank=True)
+        # Action Space.
+        action_space = IntBox(2, shape=(3, 2))
+
+        action_adapter = CategoricalDistributionAdapter(action_space=action_space)
+        test = ComponentTest(
+            component=action_adapter, input_spaces=dict(
+                inputs=previous_nn_layer_space,
+                adapter_outputs=adapter_outputs_space,
+                actions=action_space.with_batch_rank()
+            ), action_space=action_space
+        )
+
+        # Batch of 4 samples.
+        adapter_outputs = adapter_outputs_space.sample(4)
+        actions = action_space.with_batch_rank().sample(4)
+
+        logits_max = np.max(adapter_outputs, axis=-1, keepdims=True)
+        log_sum_exp = np.log(np.sum(np.exp(adapter_outputs - logits_max), axis=-1)) + np.squeeze(logits_max, axis=-1)
+        expected_log_probs = np.take_along_axis(
+            adapter_outputs, np.expand_dims(actions, axis=-1), axis=-1
+        ).squeeze(axis=-1) - log_sum_exp
+        test.test(("get_log_prob_of_actions", [adapter_outputs, actions]), expected_outputs=expected_log_probs,
+                  decimals=5)
+
+    @unittest.skipIf(get_backend() != "pytorch", "torch.compile only exists on the pytorch backend.")
+    def test_categorical_action_adapter_with_torch_compile(self):
+        if not hasattr(torch, "compile"):
+            self.skipTest("torch.compile requires torch>=2.0.")
+
+        # Last NN layer.
+        previous_nn_layer_space = FloatBox(shape=(16,), add_batch_rank=True)
+        adapter_outputs_space = FloatBox(shape=(3, 2, 2), add_batch_rank=True)
+        # Action Space.
+        action_space = IntBox(2, shape=(3, 2))
+
+        action_adapter = CategoricalDistributionAdapter(action_space=action_space, torch_compile=True)
+        test = ComponentTest(
+            component=action_adapter, input_spaces=dict(
+                inputs=previous_nn_layer_space,
+                adapter_outputs=adapter_outputs_space,
+            ), action_space=action_space
+        )
+
+        # Batch of 4 samples.
+        adapter_outputs = adapter_outputs_space.sample(4)
+
+        # Compiled path must match the eager (uncompiled) one.
+        parameters, probs, log_probs = CategoricalDistributionAdapter._get_parameters_probs_log_probs_pytorch(
+            torch.tensor(adapter_outputs)
+        )
+        test.test(("get_parameters_from_adapter_outputs", adapter_outputs), expected_outputs=dict(
+            parameters=parameters.numpy(), probabilities=probs.numpy(), log_probs=log_probs.numpy()
+        ), decimals=5)
+
+    @unittest.skipIf(get_backend() == "pytorch", "Only non-pytorch backends reject `torch_compile`.")
+    def test_categorical_action_adapter_torch_compile_on_non_pytorch_backend(self):
+        self.assertRaises(RLGraphError, CategoricalDistributionAdapter, action_space=IntBox(2), torch_compile=True)
+
     def test_simple_action_adapter_with_batch_apply(self):
         # Last NN layer.
         previous_nn_layer_space = FloatBox(shape=(16,), add_batch_rank=True, add_time_rank=True, time_major=True)
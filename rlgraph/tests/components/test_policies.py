@@ -196,6 +196,49 @@ class TestPolicies(unittest.TestCase):
         self.assertTrue(out["entropy"].dtype == np.float32)
         self.assertTrue(out["entropy"].shape == (2,))
 
+    def test_policy_log_likelihood_for_categorical_container_action_space_with_time_rank(self):
+        state_space = FloatBox(shape=(3,), add_batch_rank=True, add_time_rank=True)
+        action_space = Dict(a=IntBox(2), b=IntBox(4), add_batch_rank=True, add_time_rank=True)
+
+        network_spec = config_from_path("configs/test_lrelu_nn.json")
+        network_spec["fold_time_rank"] = True
+        network_spec["unfold_time_rank"] = True
+        policy = Policy(
+            network_spec=network_spec,
+            action_adapter_spec=dict(fold_time_rank=True, unfold_time_rank=True),
+            action_space=action_space
+        )
+        test = ComponentTest(
+            component=policy,
+            input_spaces=dict(
+                nn_inputs=state_space,
+                actions=action_space,
+            ),
+            action_space=action_space
+        )
+
+        # Batch of 2, 3 timesteps.
+        states = state_space.sample(size=(2, 3))
+        # Arbitrary (not necessarily greedy) actions.
+        actions = action_space.sample(size=(2, 3))
+        adapter_outputs = test.test(("get_adapter_outputs", states), expected_outputs=None)["adapter_outputs"]
+
+        # Log-likelihood as given by the Categorical distributions (log(softmax(logits))[action]), summed over keys.
+        expected_log_llh_output = np.zeros(shape=(2, 3))
+        for key in ["a", "b"]:
+            logits = adapter_outputs[key]
+            logits_max = np.max(logits, axis=-1, keepdims=True)
+            log_probs = logits - logits_max - np.log(np.sum(np.exp(logits - logits_max), axis=-1, keepdims=True))
+            expected_log_llh_output += np.take_along_axis(
+                log_probs, np.expand_dims(actions[key], axis=-1), axis=-1
+            ).squeeze(axis=-1)
+
+        test.test(
+            ("get_log_likelihood", [states, actions], "log_likelihood"),
+            expected_outputs=dict(log_likelihood=expected_log_llh_output),
+            decimals=5
+        )
+
     def test_shared_value_function_policy_for_discrete_action_space(self):
         # state_space (NN is a simple single fc-layer relu network (2 units), random biases, random weights).
         state_space = FloatBox(shape=(4,), add_batch_rank=True)
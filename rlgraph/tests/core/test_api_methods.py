@@ -182,7 +182,7 @@ class TestAPIMethods(unittest.TestCase):
 
         @graph_fn(component=container)
         def _graph_fn_sum(self_, *inputs):
-            return sum(inputs)
+            return tf.add_n(inputs) if len(inputs) > 1 else inputs[0]
 
         test = ComponentTest(component=container, input_spaces=dict(input_=float))
         test.test(("test", 1.23), expected_outputs=len(sub_comps) * (1.23 + 1), decimals=2)
@@ -220,7 +220,7 @@ class TestAPIMethods(unittest.TestCase):
         def _graph_fn_sum(self_, *inputs):
             summary_op = tf.compat.v1.summary.histogram("summary_sum", inputs)
             self_.register_summary_op(summary_op)
-            return sum(inputs)
+            return tf.add_n(inputs) if len(inputs) > 1 else inputs[0]
 
         @rlgraph_api(component=container)
         def _graph_fn_graph_api(self_):
@@ -264,12 +264,16 @@ class TestAPIMethods(unittest.TestCase):
         )
         test.graph_executor.summary_writer.add_summary = mock.Mock()
 
+        summary_sum_tag = regex_pattern(container.scope + "/summary_sum" + r"(_\d)?")
+        summary_inc_tag = regex_pattern(container.scope + "/summary_inc" + r"(_\d)?")
+        summary_graph_api_tag = regex_pattern(container.scope + "/summary_graph_api" + r"(_\d)?")
+
         test.test((add, [1.0, 2.0]), expected_outputs=3.0, decimals=2)
         assert test.graph_executor.summary_writer.add_summary.call_count == 1
         summary, step = test.graph_executor.summary_writer.add_summary.call_args[0]
         summary = self._parse_summary_if_needed(summary)
         assert len(summary.value) == 1
-        assert summary.value[0].tag == regex_pattern(container.scope + "/summary_sum" + r"(_\d)?")
+        assert summary.value[0].tag == summary_sum_tag
         assert step == 0
 
         test.graph_executor.summary_writer.add_summary.reset_mock()
@@ -296,7 +300,7 @@ class TestAPIMethods(unittest.TestCase):
         summary, step = test.graph_executor.summary_writer.add_summary.call_args[0]
         summary = self._parse_summary_if_needed(summary)
         assert len(summary.value) == 1
-        assert summary.value[0].tag == regex_pattern(container.scope + "/summary_sum" + r"(_\d)?")
+        assert summary.value[0].tag == summary_sum_tag
         assert step == 1
 
         test.graph_executor.summary_writer.add_summary.reset_mock()
@@ -305,9 +309,9 @@ class TestAPIMethods(unittest.TestCase):
         summary, step = test.graph_executor.summary_writer.add_summary.call_args[0]
         summary = self._parse_summary_if_needed(summary)
         assert len(summary.value) == 3
-        assert summary.value[0].tag == regex_pattern(container.scope + "/summary_sum" + r"(_\d)?")
-        assert summary.value[1].tag == regex_pattern(container.scope + "/summary_inc" + r"(_\d)?")
-        assert summary.value[2].tag == regex_pattern(container.scope + "/summary_graph_api" + r"(_\d)?")
+        assert summary.value[0].tag == summary_sum_tag
+        assert summary.value[1].tag == summary_inc_tag
+        assert summary.value[2].tag == summary_graph_api_tag
         assert step == 2
 
 
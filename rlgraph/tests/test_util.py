@@ -146,12 +146,13 @@ def recursive_assert_almost_equal(x, y, decimals=7, atol=None, rtol=None):
 class regex_pattern(object):
     def __init__(self, pattern):
         self.pattern = pattern
+        self.regex = re.compile(pattern)
 
     def __eq__(self, other):
-        return re.match(self.pattern, other) is not None
+        return self.regex.match(other) is not None
 
     def __ne__(self, other):
-        return not re.match(self.pattern, other)
+        return not self.regex.match(other)
 
     def __str__(self):
         return "~ {}".format(self.pattern)